@@ -159,7 +159,7 @@ def select_files(files: Iterable[str], include: str | Iterable[str]) -> list[str
     """
 
     files = list(files)
-    excluded_files = exclude_files(files, include)
+    excluded_files = set(exclude_files(files, include))
     return [file for file in files if file not in excluded_files]
 
 
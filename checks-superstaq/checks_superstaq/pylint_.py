@@ -67,9 +67,9 @@ def run(
     args_to_pass.append(f"-j{parsed_args.cores}")
 
     if files:
-        return subprocess.call(
-            ["python", "-m", "pylint", *files, *args_to_pass], cwd=check_utils.root_dir
-        )
+        command = ["python", "-m", "pylint", *files, *args_to_pass]
+        # pylint doesn't rely on any inherited file descriptors, so skip closing them all at fork
+        return subprocess.run(command, cwd=check_utils.root_dir, close_fds=False).returncode
 
     return 0
 
@@ -2,210 +2,50 @@ from __future__ import annotations
 
 from general_superstaq.typing import Target
 
+_TARGET_PROPERTIES = (
+    "supports_submit",
+    "supports_submit_qubo",
+    "supports_compile",
+    "available",
+    "retired",
+)
+
+# Each row holds a target name followed by its value for each of `_TARGET_PROPERTIES`.
+_TARGET_TABLE: tuple[tuple[str, bool, bool, bool, bool, bool], ...] = (
+    ("aqt_keysight_qpu", False, False, True, True, False),
+    ("aqt_zurich_qpu", False, False, True, True, False),
+    ("aws_dm1_simulator", True, False, True, True, False),
+    ("aws_sv1_simulator", True, False, True, True, False),
+    ("aws_tn1_simulator", True, False, True, True, False),
+    ("cq_sqale_qpu", False, False, True, True, False),
+    ("cq_sqale_simulator", False, False, True, True, False),
+    ("ibmq_brisbane_qpu", True, False, True, True, False),
+    ("ibmq_fake-athens_qpu", True, False, True, True, False),
+    ("ibmq_fake-lima_qpu", True, False, True, True, False),
+    ("ibmq_kyoto_qpu", True, False, True, True, False),
+    ("ionq_aria-1_qpu", False, False, True, False, False),
+    ("ionq_aria-2_qpu", False, False, True, False, False),
+    ("ionq_forte-1_qpu", False, False, True, False, False),
+    ("ionq_harmony_qpu", False, False, True, False, True),
+    ("ionq_ion_simulator", True, False, True, True, False),
+    ("oxford_lucy_qpu", False, False, True, False, False),
+    ("qtm_h1-1_qpu", False, False, True, True, False),
+    ("qtm_h1-1e_simulator", False, False, True, True, False),
+    ("qtm_h2-1_qpu", False, False, True, True, False),
+    ("rigetti_aspen-10_qpu", False, False, True, False, True),
+    ("rigetti_aspen-11_qpu", False, False, True, False, True),
+    ("rigetti_aspen-8_qpu", False, False, True, False, True),
+    ("rigetti_aspen-9_qpu", False, False, True, False, True),
+    ("rigetti_aspen-m-1_qpu", False, False, True, False, True),
+    ("rigetti_aspen-m-2_qpu", False, False, True, False, True),
+    ("rigetti_aspen-m-3_qpu", False, False, True, False, False),
+    ("qscout_peregrine_qpu", False, False, True, True, False),
+    ("ss_unconstrained_simulator", True, True, True, True, False),
+)
+
 TARGET_LIST = {
-    "aqt_keysight_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "aqt_zurich_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "aws_dm1_simulator": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "aws_sv1_simulator": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "aws_tn1_simulator": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "cq_sqale_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "cq_sqale_simulator": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "ibmq_brisbane_qpu": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "ibmq_fake-athens_qpu": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "ibmq_fake-lima_qpu": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "ibmq_kyoto_qpu": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "ionq_aria-1_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": False,
-    },
-    "ionq_aria-2_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": False,
-    },
-    "ionq_forte-1_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": False,
-    },
-    "ionq_harmony_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "ionq_ion_simulator": {
-        "supports_submit": True,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "oxford_lucy_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": False,
-    },
-    "qtm_h1-1_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "qtm_h1-1e_simulator": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "qtm_h2-1_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "rigetti_aspen-10_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "rigetti_aspen-11_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "rigetti_aspen-8_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "rigetti_aspen-9_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "rigetti_aspen-m-1_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "rigetti_aspen-m-2_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": True,
-    },
-    "rigetti_aspen-m-3_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": False,
-        "retired": False,
-    },
-    "qscout_peregrine_qpu": {
-        "supports_submit": False,
-        "supports_submit_qubo": False,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
-    "ss_unconstrained_simulator": {
-        "supports_submit": True,
-        "supports_submit_qubo": True,
-        "supports_compile": True,
-        "available": True,
-        "retired": False,
-    },
+    target_name: dict(zip(_TARGET_PROPERTIES, properties))
+    for target_name, *properties in _TARGET_TABLE
 }
 
 RETURNED_TARGETS = [
@@ -1,4 +1,9 @@
-from . import benchmark, converters, features, plotting, qcvv, simulation, stabilizers
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from . import benchmark, converters, features, simulation, stabilizers
 from ._version import __version__
 from .benchmarks import (
     bit_code,
@@ -11,6 +16,20 @@ from .benchmarks import (
     vqe_proxy,
 )
 
+if TYPE_CHECKING:
+    from . import plotting, qcvv  # noqa: TC004
+
+# Submodules with heavy dependencies (scikit-learn, pandas, matplotlib, etc.), which are only
+# imported when first accessed.
+_LAZY_SUBMODULES = ("plotting", "qcvv")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "__version__",
     "benchmark",
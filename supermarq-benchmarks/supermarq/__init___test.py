@@ -0,0 +1,28 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import supermarq
+
+
+def test_lazy_submodules() -> None:
+    code = (
+        "import sys, supermarq; "
+        "assert 'supermarq.plotting' not in sys.modules; "
+        "assert 'supermarq.qcvv' not in sys.modules; "
+        "assert supermarq.plotting is sys.modules['supermarq.plotting']; "
+        "assert supermarq.qcvv.IRB is sys.modules['supermarq.qcvv'].IRB"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_getattr() -> None:
+    assert supermarq.plotting is sys.modules["supermarq.plotting"]
+    assert supermarq.qcvv is sys.modules["supermarq.qcvv"]
+
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_module'"):
+        _ = supermarq.not_a_module
@@ -1,6 +1,10 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import cirq
+import numpy as np
+import pytest
+
 import supermarq
 from supermarq.benchmarks.vqe_proxy import VQEProxy
 
@@ -16,3 +20,26 @@ def test_vqe_score() -> None:
     circuits = vqe.circuit()
     probs = [supermarq.simulation.get_ideal_counts(circ) for circ in circuits]
     assert vqe.score(probs) > 0.99
+
+
+def test_vqe_expectation_value() -> None:
+    vqe = VQEProxy(3, 1)
+
+    # Each X and ZZ-term contributes +1 (-1) for each (anti-)aligned qubit or pair of qubits
+    assert vqe._get_expectation_value_from_probs({"000": 1.0}, {"000": 1.0}) == 6.0
+    assert vqe._get_expectation_value_from_probs({"010": 1.0}, {"011": 1.0}) == -2.0
+    assert vqe._get_expectation_value_from_probs(
+        {"000": 0.5, "010": 0.25, "101": 0.25}, {"000": 0.5, "111": 0.5}
+    ) == pytest.approx(1.0)
+
+    # The energy computed from the state vector matches that computed from sampled probabilities
+    params = np.random.default_rng(0).uniform(0, 2 * np.pi, size=12)
+    circuit_z, circuit_x = vqe._gen_ansatz(params)
+    expected_energy = vqe._get_expectation_value_from_probs(
+        supermarq.simulation.get_ideal_counts(circuit_z),
+        supermarq.simulation.get_ideal_counts(circuit_x),
+    )
+    state_vector = cirq.final_state_vector(circuit_z, ignore_terminal_measurements=True)
+    assert vqe._get_expectation_value_from_state_vector(state_vector) == pytest.approx(
+        expected_energy, abs=1e-6
+    )
@@ -1,10 +1,34 @@
 from __future__ import annotations
 
+import functools
+
 import cirq
+import qiskit
 
 import supermarq
 
 
+@functools.lru_cache(maxsize=128)
+def _cirq_to_qiskit(circuit: cirq.FrozenCircuit) -> qiskit.QuantumCircuit:
+    # Note: this module-level cache keeps up to 128 cirq circuits (and their qiskit conversions)
+    # alive for the lifetime of the process
+    return supermarq.converters.cirq_to_qiskit(circuit.unfreeze(copy=False))
+
+
+def _to_qiskit(circuit: cirq.AbstractCircuit) -> qiskit.QuantumCircuit:
+    """Converts a `cirq.Circuit` to a `qiskit.QuantumCircuit`, reusing previous conversions of the
+    same circuit (e.g. when computing several features of it).
+
+    Args:
+        circuit: A quantum circuit.
+
+    Returns:
+        A (new) qiskit circuit equivalent to the input circuit. A copy is always returned because
+        some of the feature computations modify the circuit in place.
+    """
+    return _cirq_to_qiskit(circuit.freeze()).copy()
+
+
 def compute_communication(circuit: cirq.Circuit) -> float:
     """Compute the *communication* feature of the input circuit.
 
@@ -17,9 +41,7 @@ def compute_communication(circuit: cirq.Circuit) -> float:
     Returns:
         The value of the communication feature for this circuit.
     """
-    return supermarq.converters.compute_communication_with_qiskit(
-        supermarq.converters.cirq_to_qiskit(circuit)
-    )
+    return supermarq.converters.compute_communication_with_qiskit(_to_qiskit(circuit))
 
 
 def compute_liveness(circuit: cirq.Circuit) -> float:
@@ -34,9 +56,7 @@ def compute_liveness(circuit: cirq.Circuit) -> float:
     Returns:
         The value of the liveness feature for this circuit.
     """
-    return supermarq.converters.compute_liveness_with_qiskit(
-        supermarq.converters.cirq_to_qiskit(circuit)
-    )
+    return supermarq.converters.compute_liveness_with_qiskit(_to_qiskit(circuit))
 
 
 def compute_parallelism(circuit: cirq.Circuit) -> float:
@@ -51,9 +71,7 @@ def compute_parallelism(circuit: cirq.Circuit) -> float:
     Returns:
         The value of the parallelism feature for this circuit.
     """
-    return supermarq.converters.compute_parallelism_with_qiskit(
-        supermarq.converters.cirq_to_qiskit(circuit)
-    )
+    return supermarq.converters.compute_parallelism_with_qiskit(_to_qiskit(circuit))
 
 
 def compute_measurement(circuit: cirq.Circuit) -> float:
@@ -68,9 +86,7 @@ def compute_measurement(circuit: cirq.Circuit) -> float:
     Returns:
         The value of the measurement feature for this circuit.
     """
-    return supermarq.converters.compute_measurement_with_qiskit(
-        supermarq.converters.cirq_to_qiskit(circuit)
-    )
+    return supermarq.converters.compute_measurement_with_qiskit(_to_qiskit(circuit))
 
 
 def compute_entanglement(circuit: cirq.Circuit) -> float:
@@ -85,9 +101,7 @@ def compute_entanglement(circuit: cirq.Circuit) -> float:
     Returns:
         The value of the entanglement feature for this circuit.
     """
-    return supermarq.converters.compute_entanglement_with_qiskit(
-        supermarq.converters.cirq_to_qiskit(circuit)
-    )
+    return supermarq.converters.compute_entanglement_with_qiskit(_to_qiskit(circuit))
 
 
 def compute_depth(circuit: cirq.Circuit) -> float:
@@ -102,6 +116,4 @@ def compute_depth(circuit: cirq.Circuit) -> float:
     Returns:
         The value of the depth feature for this circuit.
     """
-    return supermarq.converters.compute_depth_with_qiskit(
-        supermarq.converters.cirq_to_qiskit(circuit)
-    )
+    return supermarq.converters.compute_depth_with_qiskit(_to_qiskit(circuit))
@@ -1,6 +1,8 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+from unittest import mock
+
 import cirq
 
 import supermarq
@@ -52,3 +54,18 @@ def test_compute_depth() -> None:
     assert test_feature >= 0 and test_feature <= 1
 
     assert supermarq.features.compute_depth(cirq.Circuit()) == 0
+
+
+def test_cirq_to_qiskit_is_cached() -> None:
+    supermarq.features._cirq_to_qiskit.cache_clear()
+    circuit = CIRCUIT + cirq.CZ(*cirq.LineQubit.range(2))
+    with mock.patch(
+        "supermarq.converters.cirq_to_qiskit", wraps=supermarq.converters.cirq_to_qiskit
+    ) as mock_cirq_to_qiskit:
+        feature = supermarq.features.compute_measurement(circuit)
+        assert feature > 0
+
+        # The cached circuit must not be modified by the feature computations
+        assert supermarq.features.compute_measurement(circuit) == feature
+        assert supermarq.features.compute_depth(circuit.copy()) >= 0
+        mock_cirq_to_qiskit.assert_called_once()
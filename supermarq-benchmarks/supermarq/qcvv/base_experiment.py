@@ -27,6 +27,7 @@ import cirq
 import cirq_superstaq as css
 import matplotlib.pyplot as plt
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from tqdm.auto import tqdm
 
@@ -130,6 +131,54 @@ class Sample:
         return "supermarq.qcvv"
 
 
+def _results_dataframe(
+    data: Sequence[Mapping[str, Any]],
+    probabilities: npt.NDArray[np.float64],
+    num_qubits: int,
+) -> pd.DataFrame:
+    """Builds a results dataframe column by column from the data and measured probabilities of
+    each sample.
+
+    Args:
+        data: The data associated with each sample.
+        probabilities: Array of shape `(len(data), 2**num_qubits)` containing the probability of
+            each bitstring (in lexicographical order) for each sample.
+        num_qubits: The number of qubits measured.
+
+    Returns:
+        A dataframe with one row per sample and one column for each data key and each bitstring.
+    """
+    columns: dict[str, Any] = {
+        key: [sample_data.get(key) for sample_data in data]
+        for key in dict.fromkeys(key for sample_data in data for key in sample_data)
+    }
+    for idx, column in enumerate(probabilities.T):
+        columns[format(idx, f"0{num_qubits}b")] = column
+    return pd.DataFrame(columns)
+
+
+def _probabilities_array(
+    probabilities: Sequence[Mapping[str, float]], num_qubits: int
+) -> npt.NDArray[np.float64]:
+    """Stacks the (canonicalized) probabilities of each sample into a single array.
+
+    Args:
+        probabilities: The probabilities of each sample, as returned by
+            `QCVVExperiment.canonicalize_probabilities`.
+        num_qubits: The number of qubits measured.
+
+    Returns:
+        Array of shape `(len(probabilities), 2**num_qubits)` containing the probability of each
+        bitstring (in lexicographical order) for each sample. Samples with no probabilities are
+        filled with NaN.
+    """
+    array = np.full((len(probabilities), 2**num_qubits), np.nan)
+    for row, sample_probabilities in zip(array, probabilities):
+        if sample_probabilities:
+            row[:] = np.fromiter(sample_probabilities.values(), dtype=np.float64, count=len(row))
+    return array
+
+
 @dataclass
 class QCVVResults(ABC):
     """A dataclass for storing the data and analyze results of the experiment. Requires
@@ -245,19 +294,17 @@ class QCVVResults(ABC):
             raise ValueError(
                 "No Superstaq job associated with these results. Cannot collect device counts."
             )
-        records = []
         device_counts = self.job.counts()
-        for counts, sample in zip(device_counts, self.samples):
-
+        samples = self.samples[: len(device_counts)]
+        probabilities = np.zeros((len(samples), 2**self.num_qubits))
+        for row, counts in zip(probabilities, device_counts):
             total = sum(counts.values())
-            probabilities = {
-                format(idx, f"0{self.num_qubits}b"): 0.0 for idx in range(2**self.num_qubits)
-            }
             for key, count in counts.items():
-                probabilities[key] = count / total
-            records.append({**sample.data, **probabilities})
+                row[int(key, 2)] = count / total
 
-        return pd.DataFrame(records)
+        return _results_dataframe(
+            [sample.data for sample in samples], probabilities, self.num_qubits
+        )
 
     @property
     def _not_analyzed(self) -> RuntimeError:
@@ -501,10 +548,11 @@ class QCVVExperiment(ABC, Generic[ResultsT]):
 
         if any(c < 0 for c in results.values()):
             raise ValueError("Probabilities/counts must be positive.")
-        if sum(results.values()) == 0:
+        total = sum(results.values())
+        if total == 0:
             raise ValueError("No non-zero counts.")
         probabilities = {
-            QCVVExperiment.canonicalize_bitstring(key, num_qubits): count / sum(results.values())
+            QCVVExperiment.canonicalize_bitstring(key, num_qubits): count / total
             for key, count in results.items()
         }
         # Add zero values for any missing bitstrings
@@ -742,21 +790,20 @@ class QCVVExperiment(ABC, Generic[ResultsT]):
         if simulator is None:
             simulator = cirq.Simulator(seed=self._rng)
 
-        records = []
+        data = []
+        probabilities = []
         for sample in tqdm(self.samples, desc="Simulating circuits"):
             result = simulator.run(sample.circuit, repetitions=repetitions)
             hist = result.histogram(key=cirq.measurement_key_name(sample.circuit))
-            probabilities = self.canonicalize_probabilities(
-                {key: count / sum(hist.values()) for key, count in hist.items()}, self.num_qubits
-            )
-            records.append(
-                {"circuit_realization": sample.circuit_realization, **sample.data, **probabilities}
-            )
+            probabilities.append(self.canonicalize_probabilities(hist, self.num_qubits))
+            data.append({"circuit_realization": sample.circuit_realization, **sample.data})
 
         return self._results_cls(
             target="local_simulator",
             experiment=self,
-            data=pd.DataFrame(records),
+            data=_results_dataframe(
+                data, _probabilities_array(probabilities, self.num_qubits), self.num_qubits
+            ),
         )
 
     def run_with_callable(
@@ -775,16 +822,19 @@ class QCVVExperiment(ABC, Generic[ResultsT]):
         Returns:
             The experiment results object.
         """
-        records = []
+        probabilities = []
         for sample in tqdm(self.samples, desc="Running circuits"):
             raw_probability = circuit_eval_func(sample.circuit, **kwargs)
-            probability = self.canonicalize_probabilities(raw_probability, self.num_qubits)
-            records.append({**sample.data, **probability})
+            probabilities.append(self.canonicalize_probabilities(raw_probability, self.num_qubits))
 
         return self._results_cls(
             target="callable",
             experiment=self,
-            data=pd.DataFrame(records),
+            data=_results_dataframe(
+                [sample.data for sample in self.samples],
+                _probabilities_array(probabilities, self.num_qubits),
+                self.num_qubits,
+            ),
         )
 
     def results_from_records(
@@ -810,18 +860,17 @@ class QCVVExperiment(ABC, Generic[ResultsT]):
         """
         sample_mapping = self._map_records_to_samples(records)
 
-        results_data = []
-        for sample, results in sample_mapping.items():
-            probabilities = self.canonicalize_probabilities(
-                results,
-                self.num_qubits,
-            )
-
-            # Add to results data
-            results_data.append({**sample.data, **probabilities})
+        probabilities = [
+            self.canonicalize_probabilities(results, self.num_qubits)
+            for results in sample_mapping.values()
+        ]
 
         return self._results_cls(
             target="records",
             experiment=self,
-            data=pd.DataFrame(results_data),
+            data=_results_dataframe(
+                [sample.data for sample in sample_mapping],
+                _probabilities_array(probabilities, self.num_qubits),
+                self.num_qubits,
+            ),
         )
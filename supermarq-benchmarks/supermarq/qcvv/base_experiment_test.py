@@ -31,7 +31,13 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from supermarq.qcvv.base_experiment import QCVVExperiment, QCVVResults, Sample, qcvv_resolver
+from supermarq.qcvv.base_experiment import (
+    QCVVExperiment,
+    QCVVResults,
+    Sample,
+    _probabilities_array,
+    qcvv_resolver,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -676,6 +682,17 @@ def test_results_from_records_bad_input(
         abc_experiment.results_from_records({sample_circuits[0].uuid: {"00": 0}})
 
 
+def test_probabilities_array() -> None:
+    probabilities = _probabilities_array(
+        [{"00": 0.1, "01": 0.2, "10": 0.3, "11": 0.4}, {}, {"00": 1.0, "01": 0, "10": 0, "11": 0}],
+        num_qubits=2,
+    )
+    np.testing.assert_array_equal(
+        probabilities,
+        [[0.1, 0.2, 0.3, 0.4], [np.nan, np.nan, np.nan, np.nan], [1.0, 0.0, 0.0, 0.0]],
+    )
+
+
 def test_canonicalize_bitstring() -> None:
     assert QCVVExperiment.canonicalize_bitstring("00", 2) == "00"
     assert QCVVExperiment.canonicalize_bitstring(1, 2) == "01"
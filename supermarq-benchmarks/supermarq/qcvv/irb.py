@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -24,9 +26,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 import scipy
-import seaborn as sns
-from tqdm.auto import trange
-from tqdm.contrib.itertools import product
+from tqdm.auto import tqdm, trange
 
 from supermarq.qcvv.base_experiment import QCVVExperiment, QCVVResults, Sample
 
@@ -37,24 +37,39 @@ if TYPE_CHECKING:
 ####################################################################################################
 # Some handy functions for 1 and 2 qubit Clifford operations
 ####################################################################################################
-def _reduce_single_qubit_clifford_seq(
-    gate_seq: list[cirq.SingleQubitCliffordGate],
-) -> cirq.SingleQubitCliffordGate:
-    """Reduces a list of single qubit clifford gates to a single gate.
+def _reduce_single_qubit_clifford_indices(indices: npt.NDArray[np.uint8]) -> int:
+    """Reduces a sequence of single qubit clifford gates, given by their indices in
+    `_SINGLE_QUBIT_CLIFFORDS`, to the index of a single gate.
+
+    Long sequences are first shortened by composing neighbouring pairs of gates with vectorized
+    lookups in the multiplication table (which is valid because the group product is
+    associative), so that only a short remainder needs to be folded in Python.
 
     Args:
-        gate_seq: The list of gates.
+        indices: The indices of the gates in the sequence.
     Returns:
-        The single reduced gate.
+        The index of the single reduced gate.
     """
-    cur = gate_seq[0]
-    for gate in gate_seq[1:]:
-        cur = cur.merged_with(gate)
-    return cur
+    while len(indices) > 32:
+        paired = _SINGLE_QUBIT_CLIFFORD_PRODUCTS[indices[: len(indices) - 1 : 2], indices[1::2]]
+        indices = np.append(paired, indices[-1]) if len(indices) % 2 else paired
+    return functools.reduce(lambda a, b: _SINGLE_QUBIT_CLIFFORD_PRODUCTS[a, b], indices)
+
+
+def _invert_single_qubit_clifford_indices(indices: npt.NDArray[np.uint8]) -> int:
+    """Finds the index of the single qubit clifford gate which inverts a sequence of gates, i.e.
+    the inverse of the product of the whole sequence.
+
+    Args:
+        indices: The indices of the gates in the sequence.
+    Returns:
+        The index of the inverting gate.
+    """
+    return _SINGLE_QUBIT_CLIFFORD_INVERSES[_reduce_single_qubit_clifford_indices(indices)]
 
 
 def _reduce_clifford_seq(
-    gate_seq: list[cirq.CliffordGate],
+    gate_seq: Sequence[cirq.CliffordGate],
 ) -> cirq.CliffordGate:
     """Reduces a list of multi qubit clifford gates to a single gate.
 
@@ -178,12 +193,129 @@ _S1_Y = [
 ]
 
 
+####################################################################################################
+# The 24 single qubit Clifford operations, enumerated once as the products of the sets
+# {I, S, H, HS, SH, HSH} and {I, X, Y, Z} so that sampling a random single qubit Clifford is a
+# single table lookup.
+####################################################################################################
+_SINGLE_QUBIT_CLIFFORDS: tuple[cirq.SingleQubitCliffordGate, ...] = tuple(
+    a.merged_with(b)
+    for a in (
+        cirq.SingleQubitCliffordGate.I,
+        cirq.SingleQubitCliffordGate.Z_sqrt,
+        cirq.SingleQubitCliffordGate.H,
+        cirq.SingleQubitCliffordGate.H.merged_with(cirq.SingleQubitCliffordGate.Z_sqrt),
+        cirq.SingleQubitCliffordGate.Z_sqrt.merged_with(cirq.SingleQubitCliffordGate.H),
+        cirq.SingleQubitCliffordGate.H.merged_with(cirq.SingleQubitCliffordGate.Z_sqrt).merged_with(
+            cirq.SingleQubitCliffordGate.H
+        ),
+    )
+    for b in (
+        cirq.SingleQubitCliffordGate.I,
+        cirq.SingleQubitCliffordGate.X,
+        cirq.SingleQubitCliffordGate.Y,
+        cirq.SingleQubitCliffordGate.Z,
+    )
+)
+
+# Index of each gate in `_SINGLE_QUBIT_CLIFFORDS`. Clifford gates hash by their tableau, so any
+# single qubit `cirq.CliffordGate` can be used as a key.
+_SINGLE_QUBIT_CLIFFORD_INDICES: dict[cirq.CliffordGate, int] = {
+    gate: idx for idx, gate in enumerate(_SINGLE_QUBIT_CLIFFORDS)
+}
+
+# Group multiplication table: entry [i, j] is the index of the gate obtained by applying gate i
+# followed by gate j.
+_SINGLE_QUBIT_CLIFFORD_PRODUCTS: npt.NDArray[np.uint8] = np.array(
+    [
+        [_SINGLE_QUBIT_CLIFFORD_INDICES[a.merged_with(b)] for b in _SINGLE_QUBIT_CLIFFORDS]
+        for a in _SINGLE_QUBIT_CLIFFORDS
+    ],
+    dtype=np.uint8,
+)
+
+# Entry i is the index of the inverse of gate i.
+_SINGLE_QUBIT_CLIFFORD_INVERSES: npt.NDArray[np.uint8] = np.array(
+    [_SINGLE_QUBIT_CLIFFORD_INDICES[gate**-1] for gate in _SINGLE_QUBIT_CLIFFORDS],
+    dtype=np.uint8,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _two_qubit_clifford(a_idx: int, b_idx: int, idx: int) -> cirq.CliffordGate:
+    """Builds one of the 11520 two qubit Clifford gates. Results are cached, as constructing the
+    gate from its operations is relatively expensive and the group is small enough to store.
+
+    For algorithm details see https://arxiv.org/abs/1402.4848 & https://arxiv.org/abs/1210.7011.
+
+    Args:
+        a_idx: The index of the single qubit Clifford gate applied to the first qubit.
+        b_idx: The index of the single qubit Clifford gate applied to the second qubit.
+        idx: Which of the 20 classes of two qubit Clifford gates to build.
+
+    Returns:
+        The two qubit clifford gate.
+    """
+    qubits = cirq.LineQubit.range(2)
+    a = _SINGLE_QUBIT_CLIFFORDS[a_idx]
+    b = _SINGLE_QUBIT_CLIFFORDS[b_idx]
+    if idx == 0:
+        return cirq.CliffordGate.from_op_list([a(qubits[0]), b(qubits[1])], qubits)
+    elif idx == 1:
+        return cirq.CliffordGate.from_op_list(
+            [
+                a(qubits[0]),
+                b(qubits[1]),
+                cirq.CZ(*qubits),
+                cirq.Y(qubits[0]) ** -0.5,
+                cirq.Y(qubits[1]) ** 0.5,
+                cirq.CZ(*qubits),
+                cirq.Y(qubits[0]) ** 0.5,
+                cirq.Y(qubits[1]) ** -0.5,
+                cirq.CZ(*qubits),
+                cirq.Y(qubits[1]) ** 0.5,
+            ],
+            qubits,
+        )
+    elif 2 <= idx <= 10:
+        idx_a = int((idx - 2) / 3)
+        idx_b = (idx - 2) % 3
+        return cirq.CliffordGate.from_op_list(
+            [
+                a(qubits[0]),
+                b(qubits[1]),
+                cirq.CZ(*qubits),
+                _S1[idx_a](qubits[0]),
+                _S1_Y[idx_b](qubits[1]),
+            ],
+            qubits,
+        )
+
+    idx_a = int((idx - 11) / 3)
+    idx_b = (idx - 11) % 3
+    return cirq.CliffordGate.from_op_list(
+        [
+            a(qubits[0]),
+            b(qubits[1]),
+            cirq.CZ(*qubits),
+            cirq.Y(qubits[0]) ** 0.5,
+            cirq.X(qubits[1]) ** -0.5,
+            cirq.CZ(*qubits),
+            _S1_Y[idx_a](qubits[0]),
+            _S1_X[idx_b](qubits[1]),
+        ],
+        qubits,
+    )
+
+
 @dataclass
 class _RBResultsBase(QCVVResults):
     _rb_decay_coefficient: float | None = None
     """Decay coefficient estimate without the interleaving gate."""
     _rb_decay_coefficient_std: float | None = None
     """Standard deviation of the decay coefficient estimate without the interleaving gate."""
+    _rb_fit: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None = None
+    """Fitted decay parameters (and their standard deviations) without the interleaving gate."""
 
     @property
     def rb_decay_coefficient(self) -> float:
@@ -215,8 +347,10 @@ class _RBResultsBase(QCVVResults):
         if self.data is None:
             raise RuntimeError("No data stored. Cannot perform fit.")
 
-        xx = self.data.query(f"experiment == '{experiment}'")["clifford_depth"]
-        yy = self.data.query(f"experiment == '{experiment}'")["0" * self.num_qubits]
+        # Fit on contiguous float arrays rather than copying the filtered dataframe
+        mask = (self.data["experiment"] == experiment).to_numpy()
+        xx = self.data["clifford_depth"].to_numpy(dtype=np.float64)[mask]
+        yy = self.data["0" * self.num_qubits].to_numpy(dtype=np.float64)[mask]
 
         popt, pcov = scipy.optimize.curve_fit(
             self.exp_decay,
@@ -257,6 +391,9 @@ class _RBResultsBase(QCVVResults):
         """
         if self.data is None:
             raise RuntimeError("No data stored. Cannot make plot.")
+
+        import seaborn as sns
+
         plot = sns.scatterplot(
             data=self.data,
             x="clifford_depth",
@@ -267,7 +404,8 @@ class _RBResultsBase(QCVVResults):
         plot.set_ylabel(r"Survival probability", fontsize=15)
         plot.set_title(r"Exponential decay of survival probability", fontsize=15)
 
-        rb_fit = self._fit_decay()
+        # Reuse the fit from the analysis if available
+        rb_fit = self._rb_fit if self._rb_fit is not None else self._fit_decay("RB")
         xx = np.linspace(0, np.max(self.data.clifford_depth))
         plot.plot(
             xx,
@@ -287,6 +425,7 @@ class _RBResultsBase(QCVVResults):
 
     def _analyze(self) -> None:
         rb_fit = self._fit_decay("RB")
+        self._rb_fit = rb_fit
         self._rb_decay_coefficient, self._rb_decay_coefficient_std = rb_fit[0][1], rb_fit[1][1]
 
 
@@ -302,6 +441,8 @@ class IRBResults(_RBResultsBase):
     """Estimate of the interleaving gate error."""
     _average_interleaved_gate_error_std: float | None = None
     """Standard deviation of the estimate for the interleaving gate error."""
+    _irb_fit: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None = None
+    """Fitted decay parameters (and their standard deviations) with the interleaving gate."""
 
     @property
     def irb_decay_coefficient(self) -> float:
@@ -355,7 +496,7 @@ class IRBResults(_RBResultsBase):
         if self.data is None:
             raise RuntimeError("No data stored. Cannot make plot.")
         plot = self._plot_results()
-        irb_fit = self._fit_decay("IRB")
+        irb_fit = self._irb_fit if self._irb_fit is not None else self._fit_decay("IRB")
         xx = np.linspace(0, np.max(self.data.clifford_depth))
         plot.plot(
             xx,
@@ -382,6 +523,7 @@ class IRBResults(_RBResultsBase):
         super()._analyze()
 
         irb_fit = self._fit_decay("IRB")
+        self._irb_fit = irb_fit
         irb_decay_coefficient, irb_decay_coefficient_std = irb_fit[0][1], irb_fit[1][1]
         interleaved_gate_error = (1 - irb_decay_coefficient / self.rb_decay_coefficient) * (
             1 - 2**-self.num_qubits
@@ -389,9 +531,8 @@ class IRBResults(_RBResultsBase):
 
         interleaved_gate_error_std = (
             (1 - 2**-self.num_qubits) / self.rb_decay_coefficient
-        ) * np.sqrt(
-            irb_decay_coefficient_std**2
-            + irb_decay_coefficient**2 * self.rb_decay_coefficient_std**2
+        ) * np.hypot(
+            irb_decay_coefficient_std, irb_decay_coefficient * self.rb_decay_coefficient_std
         )
 
         self._irb_decay_coefficient = irb_decay_coefficient
@@ -553,6 +694,9 @@ class IRB(QCVVExperiment[_RBResultsBase]):
         self.clifford_op_gateset = clifford_op_gateset
         """The gateset to use when implementing Clifford operations."""
 
+        self._compiled_cliffords: dict[cirq.CliffordGate, cirq.FrozenCircuit] = {}
+        """Cache of the circuits implementing each Clifford gate in the chosen gateset."""
+
         if self.interleaved_gate is None:
             results_cls: type[RBResults] | type[IRBResults] = RBResults
         else:
@@ -574,18 +718,32 @@ class IRB(QCVVExperiment[_RBResultsBase]):
     ) -> cirq.Circuit:
         """Converts a Clifford gate to a circuit using the desired gateset for the experiment.
 
+        Compiled circuits are cached per Clifford gate, so each distinct gate is only decomposed and
+        optimized once per experiment.
+
         Args:
             clifford: The clifford operation to convert.
 
         Returns:
             A circuit implementing the desired Clifford gate.
         """
-        circuit = cirq.Circuit(
-            cirq.decompose_clifford_tableau_to_operations(
-                list(self.qubits), clifford.clifford_tableau
+        if (compiled := self._compiled_cliffords.get(clifford)) is None:
+            circuit = cirq.Circuit(
+                cirq.decompose_clifford_tableau_to_operations(
+                    list(self.qubits), clifford.clifford_tableau
+                )
             )
-        )
-        return cirq.optimize_for_target_gateset(circuit, gateset=self.clifford_op_gateset)
+            compiled = cirq.optimize_for_target_gateset(
+                circuit, gateset=self.clifford_op_gateset
+            ).freeze()
+            self._compiled_cliffords[clifford] = compiled
+        return compiled.unfreeze(copy=False)
+
+    @functools.cached_property
+    def _single_qubit_clifford_circuits(self) -> tuple[cirq.Circuit, ...]:
+        """The compiled circuit for each of the single qubit Clifford gates, in the same order as
+        `_SINGLE_QUBIT_CLIFFORDS` so they can be looked up directly by index."""
+        return tuple(self._clifford_gate_to_circuit(gate) for gate in _SINGLE_QUBIT_CLIFFORDS)
 
     def random_single_qubit_clifford(self) -> cirq.SingleQubitCliffordGate:
         """Choose a random single qubit clifford gate.
@@ -593,27 +751,19 @@ class IRB(QCVVExperiment[_RBResultsBase]):
         Returns:
             The random clifford gate.
         """
-        Id = cirq.SingleQubitCliffordGate.I
-        H = cirq.SingleQubitCliffordGate.H
-        S = cirq.SingleQubitCliffordGate.Z_sqrt
-        X = cirq.SingleQubitCliffordGate.X
-        Y = cirq.SingleQubitCliffordGate.Y
-        Z = cirq.SingleQubitCliffordGate.Z
-
-        set_A = np.array(
-            [
-                Id,
-                S,
-                H,
-                _reduce_single_qubit_clifford_seq([H, S]),
-                _reduce_single_qubit_clifford_seq([S, H]),
-                _reduce_single_qubit_clifford_seq([H, S, H]),
-            ]
-        )
+        return _SINGLE_QUBIT_CLIFFORDS[self._rng.integers(len(_SINGLE_QUBIT_CLIFFORDS))]
 
-        set_B = np.array([Id, X, Y, Z])
+    def _random_single_qubit_clifford_indices(self, size: int) -> npt.NDArray[np.uint8]:
+        """Choose a batch of random single qubit clifford gates with a single call to the random
+        number generator.
 
-        return _reduce_single_qubit_clifford_seq([self._rng.choice(set_A), self._rng.choice(set_B)])
+        Args:
+            size: The number of gates to choose.
+
+        Returns:
+            The indices of the chosen gates in the table of single qubit Clifford gates.
+        """
+        return self._rng.integers(len(_SINGLE_QUBIT_CLIFFORDS), size=size, dtype=np.uint8)
 
     def random_two_qubit_clifford(self) -> cirq.CliffordGate:
         """Choose a random two qubit clifford gate.
@@ -623,57 +773,10 @@ class IRB(QCVVExperiment[_RBResultsBase]):
         Returns:
             The random clifford gate.
         """
-        qubits = cirq.LineQubit.range(2)
-        a = self.random_single_qubit_clifford()
-        b = self.random_single_qubit_clifford()
+        a = self._rng.integers(len(_SINGLE_QUBIT_CLIFFORDS))
+        b = self._rng.integers(len(_SINGLE_QUBIT_CLIFFORDS))
         idx = self._rng.integers(20)
-        if idx == 0:
-            return cirq.CliffordGate.from_op_list([a(qubits[0]), b(qubits[1])], qubits)
-        elif idx == 1:
-            return cirq.CliffordGate.from_op_list(
-                [
-                    a(qubits[0]),
-                    b(qubits[1]),
-                    cirq.CZ(*qubits),
-                    cirq.Y(qubits[0]) ** -0.5,
-                    cirq.Y(qubits[1]) ** 0.5,
-                    cirq.CZ(*qubits),
-                    cirq.Y(qubits[0]) ** 0.5,
-                    cirq.Y(qubits[1]) ** -0.5,
-                    cirq.CZ(*qubits),
-                    cirq.Y(qubits[1]) ** 0.5,
-                ],
-                qubits,
-            )
-        elif 2 <= idx <= 10:
-            idx_a = int((idx - 2) / 3)
-            idx_b = (idx - 2) % 3
-            return cirq.CliffordGate.from_op_list(
-                [
-                    a(qubits[0]),
-                    b(qubits[1]),
-                    cirq.CZ(*qubits),
-                    _S1[idx_a](qubits[0]),
-                    _S1_Y[idx_b](qubits[1]),
-                ],
-                qubits,
-            )
-
-        idx_a = int((idx - 11) / 3)
-        idx_b = (idx - 11) % 3
-        return cirq.CliffordGate.from_op_list(
-            [
-                a(qubits[0]),
-                b(qubits[1]),
-                cirq.CZ(*qubits),
-                cirq.Y(qubits[0]) ** 0.5,
-                cirq.X(qubits[1]) ** -0.5,
-                cirq.CZ(*qubits),
-                _S1_Y[idx_a](qubits[0]),
-                _S1_X[idx_b](qubits[1]),
-            ],
-            qubits,
-        )
+        return _two_qubit_clifford(int(a), int(b), int(idx))
 
     def random_clifford(self) -> cirq.CliffordGate:
         """Returns:
@@ -713,6 +816,77 @@ class IRB(QCVVExperiment[_RBResultsBase]):
             ).item(),
         }
 
+    def _invert_clifford_seq(self, gate_seq: Sequence[cirq.CliffordGate]) -> cirq.CliffordGate:
+        """Finds the Clifford gate which inverts a sequence of Clifford gates. Single qubit
+        sequences are instead inverted directly from their indices, see
+        `_invert_single_qubit_clifford_indices`.
+
+        Args:
+            gate_seq: The sequence of gates to invert.
+
+        Returns:
+            The inverting gate.
+        """
+        return _reduce_clifford_seq(cirq.inverse(gate_seq))  # type: ignore[arg-type]
+
+    def _single_qubit_sequence_circuits(
+        self, indices: npt.NDArray[np.uint8]
+    ) -> tuple[list[cirq.Circuit], cirq.Circuit, cirq.Circuit | None]:
+        """Looks up the compiled circuits for a sequence of single qubit Clifford gates, along
+        with the circuits inverting the sequence for the RB and IRB experiments.
+
+        Args:
+            indices: The indices of the gates in the sequence.
+
+        Returns:
+            The circuit for each gate in the sequence, the circuit inverting the sequence, and the
+            circuit inverting the sequence with the interleaved gate after each gate (or None if
+            there is no interleaved gate).
+        """
+        base_circuits = [self._single_qubit_clifford_circuits[idx] for idx in indices]
+        rb_inverse_circuit = self._single_qubit_clifford_circuits[
+            _invert_single_qubit_clifford_indices(indices)
+        ]
+        if self.interleaved_gate is None:
+            return base_circuits, rb_inverse_circuit, None
+
+        # Compose each random Clifford with the interleaved gate that follows it, so only
+        # `len(indices)` (rather than `2 * len(indices)`) gates need to be reduced
+        interleaved_index = _SINGLE_QUBIT_CLIFFORD_INDICES[self.interleaved_gate]
+        irb_indices = _SINGLE_QUBIT_CLIFFORD_PRODUCTS[indices, interleaved_index]
+        irb_inverse_circuit = self._single_qubit_clifford_circuits[
+            _invert_single_qubit_clifford_indices(irb_indices)
+        ]
+        return base_circuits, rb_inverse_circuit, irb_inverse_circuit
+
+    def _two_qubit_sequence_circuits(
+        self, depth: int
+    ) -> tuple[list[cirq.Circuit], cirq.Circuit, cirq.Circuit | None]:
+        """Draws a random sequence of two qubit Clifford gates and compiles it, along with the
+        circuits inverting the sequence for the RB and IRB experiments.
+
+        Args:
+            depth: The number of gates in the sequence.
+
+        Returns:
+            The circuit for each gate in the sequence, the circuit inverting the sequence, and the
+            circuit inverting the sequence with the interleaved gate after each gate (or None if
+            there is no interleaved gate).
+        """
+        base_sequence = [self.random_two_qubit_clifford() for _ in range(depth)]
+        base_circuits = [self._clifford_gate_to_circuit(gate) for gate in base_sequence]
+        rb_inverse_circuit = self._clifford_gate_to_circuit(
+            self._invert_clifford_seq(base_sequence)
+        )
+        if self.interleaved_gate is None:
+            return base_circuits, rb_inverse_circuit, None
+
+        irb_sequence = [elem for x in base_sequence for elem in (x, self.interleaved_gate)]
+        irb_inverse_circuit = self._clifford_gate_to_circuit(
+            self._invert_clifford_seq(irb_sequence)
+        )
+        return base_circuits, rb_inverse_circuit, irb_inverse_circuit
+
     def _build_circuits(self, num_circuits: int, cycle_depths: Iterable[int]) -> Sequence[Sample]:
         """Build a list of randomised circuits required for the IRB experiment.
 
@@ -723,16 +897,38 @@ class IRB(QCVVExperiment[_RBResultsBase]):
         Returns:
             The list of experiment samples.
         """
+        circuit_depths = list(itertools.product(range(num_circuits), cycle_depths))
+        depths = [depth for _, depth in circuit_depths]
+        if self.num_qubits == 1:
+            # Draw the random Cliffords for every circuit at once, then split them per circuit
+            all_indices = self._random_single_qubit_clifford_indices(sum(depths))
+            sequence_circuits = map(
+                self._single_qubit_sequence_circuits,
+                np.split(all_indices, np.cumsum(depths[:-1], dtype=int)),
+            )
+        else:
+            sequence_circuits = map(self._two_qubit_sequence_circuits, depths)
+
+        interleaved_moment = (
+            cirq.Moment(self.interleaved_gate(*self.qubits).with_tags("no_compile"))
+            if self.interleaved_gate is not None
+            else None
+        )
+        measurement = cirq.measure(sorted(self.qubits))
+
         samples = []
-        for k, depth in product(range(num_circuits), cycle_depths, desc="Building circuits"):
-            base_sequence = [self.random_clifford() for _ in range(depth)]
-            rb_sequence = base_sequence + [
-                _reduce_clifford_seq(cirq.inverse(base_sequence))  # type: ignore[arg-type]
-            ]
-            rb_circuit = cirq.Circuit(self._clifford_gate_to_circuit(gate) for gate in rb_sequence)
+        for (k, depth), (base_circuits, rb_inverse_circuit, irb_inverse_circuit) in tqdm(
+            zip(circuit_depths, sequence_circuits),
+            total=len(circuit_depths),
+            desc="Building circuits",
+            mininterval=0.5,
+        ):
+            rb_circuit = cirq.Circuit.from_moments(
+                *itertools.chain.from_iterable(base_circuits), *rb_inverse_circuit
+            )
             samples.append(
                 Sample(
-                    circuit=rb_circuit + cirq.measure(sorted(self.qubits)),
+                    circuit=rb_circuit + measurement,
                     data={
                         "clifford_depth": depth,
                         "circuit_depth": len(rb_circuit),
@@ -747,25 +943,20 @@ class IRB(QCVVExperiment[_RBResultsBase]):
                     circuit_realization=k,
                 ),
             )
-            if self.interleaved_gate is not None:
-                # Find final gate
-                irb_sequence = [elem for x in base_sequence for elem in (x, self.interleaved_gate)]
-                irb_sequence_final_gate = _reduce_clifford_seq(
-                    cirq.inverse(irb_sequence)  # type: ignore[arg-type]
-                )
-
-                irb_circuit = cirq.Circuit()
-                for gate in base_sequence:
-                    irb_circuit += self._clifford_gate_to_circuit(gate)
-                    irb_circuit += self.interleaved_gate(*self.qubits).with_tags("no_compile")
-                # Add the final inverting gate
-                irb_circuit += self._clifford_gate_to_circuit(
-                    irb_sequence_final_gate,
+            if interleaved_moment is not None and irb_inverse_circuit is not None:
+                irb_circuit = cirq.Circuit.from_moments(
+                    *(
+                        moment
+                        for base_circuit in base_circuits
+                        for moment in (*base_circuit, interleaved_moment)
+                    ),
+                    # Add the final inverting gate
+                    *irb_inverse_circuit,
                 )
 
                 samples.append(
                     Sample(
-                        circuit=irb_circuit + cirq.measure(sorted(self.qubits)),
+                        circuit=irb_circuit + measurement,
                         data={
                             "clifford_depth": depth,
                             "circuit_depth": len(irb_circuit),
@@ -21,6 +21,7 @@ import re
 from unittest.mock import MagicMock, patch
 
 import cirq
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -101,13 +102,60 @@ def test_reduce_clifford_sequence() -> None:
         cirq.ops.SingleQubitCliffordGate.Z,
     ]
 
-    combined_gate = supermarq.qcvv.irb._reduce_clifford_seq(sequence)  # type: ignore[arg-type]
+    combined_gate = supermarq.qcvv.irb._reduce_clifford_seq(sequence)
     assert combined_gate == cirq.ops.SingleQubitCliffordGate.Z
 
 
+@pytest.mark.parametrize("length", [1, 2, 33, 64, 101])
+def test_reduce_single_qubit_clifford_indices(length: int) -> None:
+    indices = np.random.default_rng(length).integers(24, size=length, dtype=np.uint8)
+    cliffords = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS
+    expected = cliffords[indices[0]]
+    for idx in indices[1:]:
+        expected = expected.merged_with(cliffords[idx])
+
+    reduced = supermarq.qcvv.irb._reduce_single_qubit_clifford_indices(indices)
+    assert cliffords[reduced] == expected
+
+
+def test_single_qubit_clifford_tables() -> None:
+    cliffords = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS
+    products = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORD_PRODUCTS
+    inverses = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORD_INVERSES
+    for i, a in enumerate(cliffords):
+        assert cliffords[inverses[i]] == a**-1
+        for j, b in enumerate(cliffords):
+            assert cliffords[products[i, j]] == a.merged_with(b)
+
+
+def test_invert_single_qubit_clifford_indices() -> None:
+    cliffords = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS
+    indices = np.array([3, 17, 5, 22, 0, 9], dtype=np.uint8)
+    inverse = cliffords[supermarq.qcvv.irb._invert_single_qubit_clifford_indices(indices)]
+    product = cliffords[indices[0]]
+    for idx in indices[1:]:
+        product = product.merged_with(cliffords[idx])
+
+    assert product.merged_with(inverse) == cirq.ops.SingleQubitCliffordGate.I
+
+
+def test_single_qubit_cliffords() -> None:
+    cliffords = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS
+    assert len(set(cliffords)) == 24
+    assert all(isinstance(gate, cirq.ops.SingleQubitCliffordGate) for gate in cliffords)
+
+
 def test_random_single_qubit_clifford(irb: IRB) -> None:
     gate = irb.random_single_qubit_clifford()
     assert isinstance(gate, cirq.ops.SingleQubitCliffordGate)
+    assert gate in supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS
+
+
+def test_random_single_qubit_clifford_indices(irb: IRB) -> None:
+    indices = irb._random_single_qubit_clifford_indices(100)
+    assert indices.shape == (100,)
+    assert indices.dtype == np.uint8
+    assert all(0 <= idx < 24 for idx in indices)
 
 
 def test_irb_random_clifford(irb: IRB) -> None:
@@ -120,6 +168,43 @@ def test_irb_random_clifford(irb: IRB) -> None:
     assert gate.num_qubits() == 2
 
 
+def test_two_qubit_clifford() -> None:
+    qubits = cirq.LineQubit.range(2)
+    a = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS[3]
+    b = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS[17]
+    gate = supermarq.qcvv.irb._two_qubit_clifford(3, 17, 0)
+    assert gate == cirq.CliffordGate.from_op_list([a(qubits[0]), b(qubits[1])], qubits)
+
+    # Gates are only constructed once
+    assert supermarq.qcvv.irb._two_qubit_clifford(3, 17, 0) is gate
+    assert len({supermarq.qcvv.irb._two_qubit_clifford(3, 17, idx) for idx in range(20)}) == 20
+
+
+def test_clifford_gate_to_circuit_cached(irb: IRB) -> None:
+    gate = cirq.ops.SingleQubitCliffordGate.X_sqrt
+    circuit = irb._clifford_gate_to_circuit(gate)
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(circuit), cirq.unitary(gate), atol=1e-8
+    )
+    assert gate in irb._compiled_cliffords
+
+    # Second call should reuse the compiled circuit
+    with patch("cirq.optimize_for_target_gateset") as mock_optimize:
+        assert irb._clifford_gate_to_circuit(gate) == circuit
+        mock_optimize.assert_not_called()
+
+
+def test_single_qubit_clifford_circuits(irb: IRB) -> None:
+    circuits = irb._single_qubit_clifford_circuits
+    assert len(circuits) == 24
+    for gate, circuit in zip(supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORDS, circuits):
+        cirq.testing.assert_allclose_up_to_global_phase(
+            circuit.unitary(qubits_that_should_be_present=irb.qubits),
+            cirq.unitary(gate),
+            atol=1e-8,
+        )
+
+
 def test_gates_per_clifford() -> None:
     exp = IRB(random_seed=1, num_circuits=10, cycle_depths=[1, 5, 10])
     gates = exp.gates_per_clifford(samples=1000)
@@ -134,15 +219,14 @@ def test_gates_per_clifford() -> None:
 
 def test_irb_build_circuit() -> None:
     irb_experiment = IRB(num_circuits=10, cycle_depths=[1, 5, 10])
-    with patch("supermarq.qcvv.irb.IRB.random_single_qubit_clifford") as mock_random_clifford:
-        mock_random_clifford.side_effect = [
-            cirq.ops.SingleQubitCliffordGate.Z,
-            cirq.ops.SingleQubitCliffordGate.Z,
-            cirq.ops.SingleQubitCliffordGate.Z,
-            cirq.ops.SingleQubitCliffordGate.X,
-            cirq.ops.SingleQubitCliffordGate.X,
-            cirq.ops.SingleQubitCliffordGate.X,
-        ]
+    z_idx = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORD_INDICES[cirq.ops.SingleQubitCliffordGate.Z]
+    x_idx = supermarq.qcvv.irb._SINGLE_QUBIT_CLIFFORD_INDICES[cirq.ops.SingleQubitCliffordGate.X]
+    with patch(
+        "supermarq.qcvv.irb.IRB._random_single_qubit_clifford_indices"
+    ) as mock_random_clifford:
+        mock_random_clifford.return_value = np.array(
+            [z_idx, z_idx, z_idx, x_idx, x_idx, x_idx], dtype=np.uint8
+        )
 
         circuits = irb_experiment._build_circuits(2, [3])
         expected_circuits = [
@@ -271,6 +355,7 @@ def test_irb_build_circuit() -> None:
             ),
         ]
 
+        mock_random_clifford.assert_called_once_with(6)
         assert len(circuits) == 4
         cirq.testing.assert_same_circuits(circuits[0].circuit, expected_circuits[0].circuit)
         assert circuits[0].data == expected_circuits[0].data
@@ -282,6 +367,30 @@ def test_irb_build_circuit() -> None:
         assert circuits[3].data == expected_circuits[3].data
 
 
+@pytest.mark.parametrize("interleaved_gate", [None, cirq.CZ])
+def test_build_circuits_two_qubits(interleaved_gate: cirq.CliffordGate | None) -> None:
+    experiment = IRB(
+        interleaved_gate=interleaved_gate,
+        qubits=2,
+        num_circuits=1,
+        cycle_depths=[2],
+        random_seed=1,
+    )
+    samples = experiment._build_circuits(2, [1, 2])
+
+    experiments = ["RB"] if interleaved_gate is None else ["RB", "IRB"]
+    assert [sample.data["experiment"] for sample in samples] == 4 * experiments
+    assert [sample.data["clifford_depth"] for sample in samples] == [
+        depth for depth in (1, 2, 1, 2) for _ in experiments
+    ]
+    for sample in samples:
+        # Every sequence is inverted by its final Clifford
+        unmeasured = cirq.drop_terminal_measurements(sample.circuit)
+        cirq.testing.assert_allclose_up_to_global_phase(
+            cirq.unitary(unmeasured), np.eye(4), atol=1e-6
+        )
+
+
 def test_analyse_results() -> None:
     irb_results = IRBResults(
         target="example", experiment=IRB(num_circuits=1, cycle_depths=[1, 2, 5, 10])
@@ -357,8 +466,10 @@ def test_analyse_results() -> None:
         0.5 * (1 - 0.8 / 0.95), abs=1e-5
     )
 
-    # Test that plotting results doesn't introduce any errors.
-    irb_results.plot_results()
+    # Test that plotting results doesn't introduce any errors, and reuses the fits from the analysis
+    with patch.object(irb_results, "_fit_decay") as mock_fit_decay:
+        irb_results.plot_results()
+        mock_fit_decay.assert_not_called()
 
 
 def test_analyse_results_rb() -> None:
@@ -405,8 +516,10 @@ def test_analyse_results_rb() -> None:
     assert rb_results.rb_decay_coefficient == pytest.approx(0.95, abs=1e-5)
     assert rb_results.average_error_per_clifford == pytest.approx(0.5 * (1 - 0.95), abs=1e-5)
 
-    # Test that plotting results doesn't introduce any errors.
-    rb_results.plot_results()
+    # Test that plotting results doesn't introduce any errors, and reuses the fit from the analysis
+    with patch.object(rb_results, "_fit_decay") as mock_fit_decay:
+        rb_results.plot_results()
+        mock_fit_decay.assert_not_called()
 
 
 def test_analyse_results_plot_saving(tmp_path: pathlib.Path) -> None:
@@ -24,7 +24,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import scipy
-import seaborn as sns
 import tqdm.auto
 import tqdm.contrib.itertools
 
@@ -90,8 +89,7 @@ class XEBResults(QCVVResults):
         )
         # Fit a linear model for each cycle depth to estimate the circuit fidelity
         records = []
-        for depth in set(self.data.cycle_depth):
-            df = self.data[self.data.cycle_depth == depth]
+        for depth, df in self.data.groupby("cycle_depth", sort=False):
             fit = scipy.stats.linregress(
                 x=df["sum_p(x)p(x)"] - 1 / 2**self.num_qubits,
                 y=df["sum_p(x)p^(x)"] - 1 / 2**self.num_qubits,
@@ -114,7 +112,7 @@ class XEBResults(QCVVResults):
         # Fit a linear model to the depth ~ log(fidelity) to approximate the cycle fidelity
         cycle_fit = scipy.stats.linregress(
             x=self._circuit_fidelities.cycle_depth,
-            y=np.log(self._circuit_fidelities.circuit_fidelity_estimate),
+            y=self._circuit_fidelities.log_fidelity_estimate,
         )
         self._cycle_fidelity_estimate = np.exp(cycle_fit.slope)
         self._cycle_fidelity_estimate_std = self.cycle_fidelity_estimate * cycle_fit.stderr
@@ -144,6 +142,8 @@ class XEBResults(QCVVResults):
                 "No stored dataframe of circuit fidelities. Something has gone wrong."
             )
 
+        import seaborn as sns
+
         fig, axs = plt.subplots(1, 2, figsize=(10, 4.8))
         colours = sns.color_palette("dark:r", n_colors=len(self.data.cycle_depth.unique()))
         for depth, color in zip(sorted(self.data.cycle_depth.unique()), colours):
@@ -214,6 +214,8 @@ class XEBResults(QCVVResults):
         if self.data is None:
             raise RuntimeError("No data stored. Cannot plot results.")
 
+        import seaborn as sns
+
         # Reformat dataframe
         df = pd.melt(
             self.data,
@@ -432,6 +434,9 @@ class XEB(QCVVExperiment[XEBResults]):
         Returns:
             The list of experiment samples.
         """
+        qubit_order = sorted(self.qubits)
+        measurement = cirq.measure(qubit_order)
+
         random_circuits = []
         for k, depth in tqdm.contrib.itertools.product(
             range(num_circuits), cycle_depths, desc="Building circuits"
@@ -451,9 +456,7 @@ class XEB(QCVVExperiment[XEBResults]):
             if self.two_qubit_gate is not None:
                 circuit = self._interleave_op(circuit, self.two_qubit_gate(*self.qubits))
 
-            analytic_final_state = cirq.final_state_vector(
-                circuit, qubit_order=sorted(circuit.all_qubits())
-            )
+            analytic_final_state = cirq.final_state_vector(circuit, qubit_order=qubit_order)
             analytic_probabilities = {
                 "exact_" + format(idx, f"0{self.num_qubits}b"): np.abs(state) ** 2
                 for idx, state in enumerate(analytic_final_state)
@@ -461,7 +464,7 @@ class XEB(QCVVExperiment[XEBResults]):
 
             random_circuits.append(
                 Sample(
-                    circuit=circuit + cirq.measure(sorted(circuit.all_qubits())),
+                    circuit=circuit + measurement,
                     data={
                         "circuit_depth": len(circuit),
                         "cycle_depth": depth,